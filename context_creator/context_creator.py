@@ -1,11 +1,11 @@
 """Module for creating context from files."""
 
+import io
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Iterator, List, Optional
-
-import pyperclip
+from typing import Iterator, List, Optional, TextIO
 
 from context_creator.file_iterator import FileIterator
 from context_creator.types import FileInfo, FilterFunction, PathLike
@@ -22,6 +22,7 @@ class ContextCreator:
         root_dir: PathLike,
         file_filter: Optional[FilterFunction] = None,
         additional_exclude_patterns: List[str] = None,
+        use_gitignore: bool = True,
     ):
         """
         Initialize the ContextCreator.
@@ -30,14 +31,20 @@ class ContextCreator:
             root_dir: The root directory to scan.
             file_filter: A function that returns True if a file should be included.
             additional_exclude_patterns: Additional patterns to exclude.
+            use_gitignore: Whether the default file filter uses .gitignore rules.
         """
         self.root_path = Path(root_dir).resolve()
         logger.debug(f"Initializing ContextCreator for directory: {self.root_path}")
         
+        # Background clipboard copy started by create_context
+        self._clipboard_thread: Optional[threading.Thread] = None
+        self._clipboard_error: Optional[Exception] = None
+        
         self.file_iterator = FileIterator(
             self.root_path,
             file_filter=file_filter,
             additional_exclude_patterns=additional_exclude_patterns,
+            use_gitignore=use_gitignore,
         )
 
     def format_file_info(self, file_info: FileInfo) -> str:
@@ -54,40 +61,116 @@ class ContextCreator:
         # ```filetype
         # content of file
         # ```
-        logger.debug(f"Formatting file: {file_info.relative_path}")
+        logger.debug("Formatting file: %s", file_info.relative_path)
         return f"{file_info.relative_path}:\n```{file_info.file_type}\n{file_info.content}\n```"
 
+    def write_file_info(self, out: TextIO, file_info: FileInfo) -> None:
+        """
+        Write a FileInfo object to a text stream.
+
+        Produces the same text as format_file_info, without first building
+        a separate string that holds a copy of the file content.
+
+        Args:
+            out: The stream to write to.
+            file_info: The FileInfo object to write.
+        """
+        # The short header is built in one step; the content is written
+        # separately so it is never copied into an intermediate string
+        out.write(f"{file_info.relative_path}:\n```{file_info.file_type}\n")
+        out.write(file_info.content)
+        out.write("\n```")
+
+    def write_context(self, out: TextIO) -> int:
+        """
+        Write the context for the files in the root directory to a text stream.
+
+        Files are written in order of their relative paths as soon as they
+        have been read, so only the files currently being read are held in
+        memory.
+
+        Args:
+            out: The stream to write to.
+
+        Returns:
+            The number of files written.
+        """
+        # Write each file, separated by double newlines
+        num_files = 0
+        for file_info in self.file_iterator.iterate_files(sort=True):
+            logger.debug("Including file: %s", file_info.relative_path)
+            if num_files:
+                out.write("\n\n")
+            self.write_file_info(out, file_info)
+            num_files += 1
+        
+        logger.info(f"Found {num_files} files to include in context")
+        return num_files
+
     def create_context(self, copy_to_clipboard: bool = True) -> str:
         """
         Create context from files in the root directory.
 
         Args:
             copy_to_clipboard: Whether to copy the context to the clipboard.
+                The copy runs in a background thread; see wait_for_clipboard.
 
         Returns:
             The generated context as a string.
         """
         logger.info(f"Creating context from directory: {self.root_path}")
         
-        # Iterate over files
-        file_infos = list(self.file_iterator.iterate_files())
-        logger.info(f"Found {len(file_infos)} files to include in context")
-        
-        for file_info in file_infos:
-            logger.debug(f"Including file: {file_info.relative_path}")
+        # Write the files, sorted by path for consistent output, into a single
+        # buffer
+        buf = io.StringIO()
+        num_files = self.write_context(buf)
+        context = buf.getvalue()
         
-        # Sort files by path for consistent output
-        file_infos.sort(key=lambda fi: str(fi.relative_path))
-        
-        # Format each file
-        formatted_files = [self.format_file_info(file_info) for file_info in file_infos]
-        
-        # Join with double newlines
-        context = "\n\n".join(formatted_files)
-        
-        # Copy to clipboard if requested
+        # Copy to clipboard if requested. This spawns a helper process and
+        # pipes the whole context to it, so it runs in the background; call
+        # wait_for_clipboard() to make sure it has finished.
         if copy_to_clipboard:
-            pyperclip.copy(context)
-            logger.info(f"Context copied to clipboard ({len(context)} characters, {len(file_infos)} files)")
+            self._clipboard_error = None
+            self._clipboard_thread = threading.Thread(
+                target=self._copy_to_clipboard,
+                args=(context, num_files),
+                daemon=True,
+            )
+            self._clipboard_thread.start()
         
-        return context 
\ No newline at end of file
+        return context
+
+    def _copy_to_clipboard(self, context: str, num_files: int) -> None:
+        """
+        Copy the context to the clipboard, recording any error.
+
+        Args:
+            context: The context to copy.
+            num_files: The number of files in the context, for logging.
+        """
+        try:
+            # Imported here, on the background thread, so runs that don't
+            # copy to the clipboard never pay for importing pyperclip
+            import pyperclip
+
+            pyperclip.copy(context)
+        except Exception as e:
+            self._clipboard_error = e
+            return
+        logger.info(f"Context copied to clipboard ({len(context)} characters, {num_files} files)")
+
+    def wait_for_clipboard(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a clipboard copy started by create_context to finish.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait
+                until the copy has finished.
+
+        Raises:
+            Exception: The error raised while copying to the clipboard, if any.
+        """
+        if self._clipboard_thread is not None:
+            self._clipboard_thread.join(timeout)
+        if self._clipboard_error is not None:
+            raise self._clipboard_error 
\ No newline at end of file
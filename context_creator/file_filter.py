@@ -1,94 +1,369 @@
 """Module for filtering files based on various criteria."""
 
+import fnmatch
+import functools
 import logging
 import mimetypes
 import os
-from pathlib import Path
-from typing import List, Set
+import re
+import stat
+from pathlib import Path, PurePath
+from typing import Callable, Iterable, List, Optional, Pattern, Set, Tuple
 
+from context_creator.file_reader import read_file_bytes
 from context_creator.gitignore_manager import GitignoreManager
-from context_creator.types import FilterFunction, PathLike
+from context_creator.types import DirFilterFunction, EntryFilterFunction, PathLike
 
 # Get logger
 logger = logging.getLogger("context_creator")
 
+# Common binary file extensions to exclude (lowercase, as returned by
+# ``_lower_suffix(path.suffix)``)
+BINARY_EXTENSIONS = frozenset({
+    ".pyc", ".pyo", ".so", ".o", ".a", ".lib", ".dll", ".exe", ".bin",
+    ".dat", ".db", ".sqlite", ".sqlite3", ".db-shm", ".db-wal",
+    ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".ico", ".tiff",
+    ".mp3", ".mp4", ".avi", ".mov", ".flv", ".wav", ".ogg",
+    ".zip", ".tar", ".gz", ".bz2", ".7z", ".rar",
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+})
+
+# Extensions that should always be considered text files
+# regardless of their MIME type. Files with these extensions are accepted
+# without a MIME lookup or reading their content.
+ALWAYS_TEXT_EXTENSIONS = frozenset({
+    ".py",    # Python
+    ".pyi",   # Python stub
+    ".c",     # C
+    ".h",     # C header
+    ".cc",    # C++
+    ".cpp",   # C++
+    ".cxx",   # C++
+    ".hpp",   # C++ header
+    ".hh",    # C++ header
+    ".cs",    # C#
+    ".java",  # Java
+    ".js",    # JavaScript
+    ".mjs",   # JavaScript module
+    ".cjs",   # CommonJS module
+    ".dart",  # Dart
+    ".lua",   # Lua
+    ".r",     # R
+    ".pm",    # Perl module
+    ".lhs",   # Literate Haskell
+    ".sh",    # Shell
+    ".bash",  # Bash
+    ".zsh",   # Zsh
+    ".fish",  # Fish
+    ".sql",   # SQL
+    ".html",  # HTML
+    ".css",   # CSS
+    ".scss",  # Sass
+    ".xml",   # XML
+    ".json",  # JSON
+    ".md",    # Markdown
+    ".rst",   # reStructuredText
+    ".txt",   # Plain text
+    ".yml",   # YAML
+    ".yaml",  # YAML
+    ".toml",  # TOML
+    ".ini",   # INI
+    ".cfg",   # Config
+    ".proto", # Protocol Buffers
+    ".rs",    # Rust
+    ".go",    # Go
+    ".ts",    # TypeScript
+    ".tsx",   # TypeScript JSX
+    ".jsx",   # JSX
+    ".vue",   # Vue
+    ".svelte", # Svelte
+    ".kt",    # Kotlin
+    ".kts",   # Kotlin Script
+    ".swift", # Swift
+    ".scala", # Scala
+    ".elm",   # Elm
+    ".hs",    # Haskell
+    ".rb",    # Ruby
+    ".php",   # PHP
+    ".pl",    # Perl
+    ".ex",    # Elixir
+    ".exs",   # Elixir Script
+    ".erl",   # Erlang
+    ".hrl",   # Erlang Header
+    ".clj",   # Clojure
+    ".fs",    # F#
+    ".fsx",   # F# Script
+})
+
+# Number of bytes read from a file of unknown type to decide if it is text
+TEXT_SNIFF_SIZE = 4096
+
+
+def _compile_glob_patterns(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into a single regular expression.
+
+    Args:
+        patterns: The glob patterns to combine.
+
+    Returns:
+        A compiled regex matching any of the patterns, or None if there are none.
+    """
+    translated = [f"(?:{fnmatch.translate(pattern)})" for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+def _has_glob_chars(pattern: str) -> bool:
+    """
+    Check whether a pattern contains fnmatch wildcard characters.
+
+    Args:
+        pattern: The pattern to check.
+
+    Returns:
+        True if the pattern contains "*", "?" or "[".
+    """
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+def _compile_name_matcher(patterns: Tuple[str, ...]) -> Optional[Callable[[str], bool]]:
+    """
+    Compile glob patterns for file names into a single matching function.
+
+    Args:
+        patterns: The glob patterns, sorted so that equal sets of patterns
+            share a cache entry.
+
+    Returns:
+        A function that returns True if a name matches any of the patterns,
+        or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    return _build_name_matcher(patterns)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_name_matcher(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a single matching function for a non-empty set of name patterns.
+
+    The patterns are bucketed by shape: names without wildcards go into a
+    set, "*.ext"-style patterns into a tuple of suffixes for str.endswith,
+    and only the remaining patterns into a combined regex. Cached so that
+    FileFilter instances created with the same patterns, for example by
+    repeated programmatic runs, share one matcher.
+
+    Args:
+        patterns: The glob patterns, sorted so that equal sets of patterns
+            share a cache entry.
+
+    Returns:
+        A function that returns True if a name matches any of the patterns.
+    """
+    names = frozenset(pattern for pattern in patterns if not _has_glob_chars(pattern))
+    suffixes = tuple(
+        pattern[1:] for pattern in patterns
+        if pattern.startswith("*") and not _has_glob_chars(pattern[1:])
+    )
+    regex = _compile_glob_patterns(
+        pattern for pattern in patterns
+        if _has_glob_chars(pattern)
+        and not (pattern.startswith("*") and not _has_glob_chars(pattern[1:]))
+    )
+    regex_match = regex.match if regex is not None else None
+
+    def matches(name: str) -> bool:
+        """Check if a name matches any of the patterns."""
+        if name in names:
+            return True
+        if suffixes and name.endswith(suffixes):
+            return True
+        return regex_match is not None and regex_match(name) is not None
+
+    return matches
+
+
+def _compile_path_pattern(pattern: str) -> Callable[[str], bool]:
+    """
+    Compile a glob pattern containing a separator into a path matcher.
+
+    The matcher gives the same result as PurePath(path).match(pattern), but
+    a relative pattern is checked by splitting off the last components of
+    the path string and matching each one with a precompiled regex, without
+    parsing a PurePath per call.
+
+    Args:
+        pattern: The glob pattern.
+
+    Returns:
+        A function that returns True if a path string matches the pattern.
+    """
+    pure_pattern = PurePath(pattern)
+    if pure_pattern.drive or pure_pattern.root:
+        # Absolute patterns have to match the whole path; they are rare
+        return lambda path: PurePath(path).match(pattern)
+    
+    num_parts = len(pure_pattern.parts)
+    part_matchers = tuple(
+        re.compile(fnmatch.translate(os.path.normcase(part))).match
+        for part in reversed(pure_pattern.parts)
+    )
+    sep = os.sep
+    altsep = os.altsep
+    normcase = os.path.normcase
+
+    def matches(path: str) -> bool:
+        """Check if a path string matches the pattern."""
+        if altsep:
+            path = path.replace(altsep, sep)
+        components = normcase(path).rsplit(sep, num_parts)
+        if len(components) < num_parts:
+            return False
+        for match_part, component in zip(part_matchers, reversed(components)):
+            if match_part(component) is None:
+                return False
+        return True
+
+    return matches
+
+
+@functools.lru_cache(maxsize=256)
+def _lower_suffix(suffix: str) -> str:
+    """
+    Lowercase a file extension.
+
+    Cached because a project has few distinct extensions, so this avoids
+    allocating a new lowercased string for every file.
+
+    Args:
+        suffix: The file extension.
+
+    Returns:
+        The lowercased file extension.
+    """
+    return suffix.lower()
+
+
+@functools.lru_cache(maxsize=512)
+def _mime_for_suffix(suffix: str) -> Optional[str]:
+    """
+    Guess the MIME type for a file extension.
+
+    The result only depends on the extension, so it is cached: a project
+    typically has a few dozen distinct extensions across thousands of files.
+
+    Args:
+        suffix: The lowercased file extension, including the leading dot.
+
+    Returns:
+        The guessed MIME type, or None if it is unknown.
+    """
+    return mimetypes.guess_type("x" + suffix)[0]
+
+
+@functools.lru_cache(maxsize=512)
+def _is_text_suffix(suffix: str) -> Optional[bool]:
+    """
+    Classify a file extension as text or binary.
+
+    Combines ALWAYS_TEXT_EXTENSIONS and the guessed MIME type into one
+    cached lookup, so classifying a file with a known extension costs a
+    single dict probe.
+
+    Args:
+        suffix: The lowercased file extension, including the leading dot.
+
+    Returns:
+        True or False if the extension decides it, or None if the content
+        has to be sniffed.
+    """
+    if suffix in ALWAYS_TEXT_EXTENSIONS:
+        return True
+    mime_type = _mime_for_suffix(suffix)
+    if mime_type is None:
+        return None
+    return mime_type.startswith("text/")
+
+
+# Default directories to exclude (only those not typically in .gitignore)
+DEFAULT_EXCLUDE_DIRS = frozenset({".git", ".vscode"})
+
+
+def _has_excluded_dir_component(path_str: str) -> bool:
+    """
+    Check if any component of a path string is in DEFAULT_EXCLUDE_DIRS.
+
+    Splitting the path and testing the components with one set operation is
+    cheaper than a regex search over the whole path.
+
+    Args:
+        path_str: The path to check.
+
+    Returns:
+        True if a component of the path is an excluded directory name.
+    """
+    if os.altsep:
+        path_str = path_str.replace(os.altsep, os.sep)
+    return not DEFAULT_EXCLUDE_DIRS.isdisjoint(path_str.split(os.sep))
+
+
+# Default files to exclude - files that are typically not useful for LLM context
+# and might not be in standard .gitignore files
+DEFAULT_EXCLUDE_FILES = frozenset({
+    # Version control
+    ".gitignore",  # Explicitly exclude .gitignore since we're using it for filtering
+
+    # Lock files that might not be gitignored in some projects
+    "Cargo.lock",  # Rust - sometimes committed, sometimes not
+    "package-lock.json",  # npm - sometimes committed
+    "yarn.lock",  # Yarn - sometimes committed
+    "pnpm-lock.yaml",  # pnpm - sometimes committed
+    "composer.lock",  # PHP - sometimes committed
+    "Gemfile.lock",  # Ruby - sometimes committed
+
+    # Generated files that might not be in .gitignore
+    "*.min.js",  # Minified JavaScript - sometimes committed
+    "*.min.css",  # Minified CSS - sometimes committed
+    "*.map",  # Source maps - sometimes committed
+
+    # Large generated files that might be committed
+    "yarn-error.log",  # Yarn error logs
+    "npm-debug.log",  # npm debug logs
+
+    # Configuration files that aren't useful for context
+    ".editorconfig",  # Editor configuration
+    ".prettierrc",  # Prettier configuration
+    ".eslintrc",  # ESLint configuration
+    ".stylelintrc",  # Stylelint configuration
+    "tsconfig.json",  # TypeScript configuration
+    "jsconfig.json",  # JavaScript configuration
+    ".babelrc",  # Babel configuration
+})
+
+# DEFAULT_EXCLUDE_FILES compiled into one matcher: a set lookup for the exact
+# names and a suffix check for the "*.ext" entries
+_is_default_excluded_name = _build_name_matcher(tuple(sorted(DEFAULT_EXCLUDE_FILES)))
+
 
 class FileFilter:
     """Class for filtering files based on various criteria."""
 
     # Common binary file extensions to exclude
-    BINARY_EXTENSIONS = {
-        ".pyc", ".pyo", ".so", ".o", ".a", ".lib", ".dll", ".exe", ".bin",
-        ".dat", ".db", ".sqlite", ".sqlite3", ".db-shm", ".db-wal",
-        ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".ico", ".tiff",
-        ".mp3", ".mp4", ".avi", ".mov", ".flv", ".wav", ".ogg",
-        ".zip", ".tar", ".gz", ".bz2", ".7z", ".rar",
-        ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-    }
+    BINARY_EXTENSIONS = BINARY_EXTENSIONS
     
     # Default directories to exclude (only those not typically in .gitignore)
-    DEFAULT_EXCLUDE_DIRS = {".git", ".vscode"}
+    DEFAULT_EXCLUDE_DIRS = DEFAULT_EXCLUDE_DIRS
     
     # Default files to exclude - files that are typically not useful for LLM context
     # and might not be in standard .gitignore files
-    DEFAULT_EXCLUDE_FILES = {
-        # Version control
-        ".gitignore",  # Explicitly exclude .gitignore since we're using it for filtering
-        
-        # Lock files that might not be gitignored in some projects
-        "Cargo.lock",  # Rust - sometimes committed, sometimes not
-        "package-lock.json",  # npm - sometimes committed
-        "yarn.lock",  # Yarn - sometimes committed
-        "pnpm-lock.yaml",  # pnpm - sometimes committed
-        "composer.lock",  # PHP - sometimes committed
-        "Gemfile.lock",  # Ruby - sometimes committed
-        
-        # Generated files that might not be in .gitignore
-        "*.min.js",  # Minified JavaScript - sometimes committed
-        "*.min.css",  # Minified CSS - sometimes committed
-        "*.map",  # Source maps - sometimes committed
-        
-        # Large generated files that might be committed
-        "yarn-error.log",  # Yarn error logs
-        "npm-debug.log",  # npm debug logs
-        
-        # Configuration files that aren't useful for context
-        ".editorconfig",  # Editor configuration
-        ".prettierrc",  # Prettier configuration
-        ".eslintrc",  # ESLint configuration
-        ".stylelintrc",  # Stylelint configuration
-        "tsconfig.json",  # TypeScript configuration
-        "jsconfig.json",  # JavaScript configuration
-        ".babelrc",  # Babel configuration
-    }
+    DEFAULT_EXCLUDE_FILES = DEFAULT_EXCLUDE_FILES
     
     # Extensions that should always be considered text files
     # regardless of their MIME type
-    ALWAYS_TEXT_EXTENSIONS = {
-        ".rs",    # Rust
-        ".go",    # Go
-        ".ts",    # TypeScript
-        ".tsx",   # TypeScript JSX
-        ".jsx",   # JSX
-        ".vue",   # Vue
-        ".svelte", # Svelte
-        ".kt",    # Kotlin
-        ".kts",   # Kotlin Script
-        ".swift", # Swift
-        ".scala", # Scala
-        ".elm",   # Elm
-        ".hs",    # Haskell
-        ".rb",    # Ruby
-        ".php",   # PHP
-        ".pl",    # Perl
-        ".ex",    # Elixir
-        ".exs",   # Elixir Script
-        ".erl",   # Erlang
-        ".hrl",   # Erlang Header
-        ".clj",   # Clojure
-        ".fs",    # F#
-        ".fsx",   # F# Script
-    }
+    ALWAYS_TEXT_EXTENSIONS = ALWAYS_TEXT_EXTENSIONS
 
     def __init__(
         self, 
@@ -105,6 +380,7 @@ class FileFilter:
             additional_exclude_patterns: Additional patterns to exclude.
         """
         self.root_path = Path(root_dir).resolve()
+        self._root_path_str = str(self.root_path)
         self.use_gitignore = use_gitignore
         self.exclude_patterns: Set[str] = set()
         
@@ -116,96 +392,196 @@ class FileFilter:
             self.exclude_patterns.update(additional_exclude_patterns)
             logger.debug(f"Additional exclude patterns: {self.exclude_patterns}")
         
+        # Patterns without a separator only ever match the file name, so they
+        # are compiled into one matcher; the rest are matched against the
+        # last components of the path
+        self._exclude_name_matcher = _compile_name_matcher(tuple(sorted(
+            pattern for pattern in self.exclude_patterns
+            if "/" not in pattern and os.sep not in pattern
+        )))
+        self._exclude_path_matchers = [
+            (pattern, _compile_path_pattern(pattern))
+            for pattern in self.exclude_patterns
+            if "/" in pattern or os.sep in pattern
+        ]
+        
         # Get the gitignore filter if requested
         self.gitignore_manager = None
         if self.use_gitignore:
             logger.debug("Creating GitignoreManager")
             self.gitignore_manager = GitignoreManager(self.root_path)
 
-    def is_text_file(self, path: Path) -> bool:
+    def is_text_file(self, path: PathLike) -> bool:
         """
         Check if a file is a text file based on its MIME type.
 
         Args:
-            path: The path to the file.
+            path: The path to the file, as a string or path-like object.
 
         Returns:
             True if the file is a text file, False otherwise.
         """
-        if not path.is_file():
-            logger.debug(f"Not a file: {path}")
+        path_str = os.fspath(path)
+        if not os.path.isfile(path_str):
+            logger.debug("Not a file: %s", path_str)
             return False
-            
-        # Check if the file extension is in our list of always-text extensions
-        if path.suffix.lower() in self.ALWAYS_TEXT_EXTENSIONS:
-            logger.debug(f"File is text (by extension override): {path}")
-            return True
 
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if mime_type is None:
-            # Try to read the file as text
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    f.read(1024)  # Read a small chunk to check if it's text
-                logger.debug(f"File is text (read test): {path}")
-                return True
-            except UnicodeDecodeError:
-                logger.debug(f"File is not text (UnicodeDecodeError): {path}")
-                return False
-        
-        is_text = mime_type.startswith("text/")
-        logger.debug(f"File is {'text' if is_text else 'not text'} (mime type: {mime_type}): {path}")
+        suffix = os.path.splitext(os.path.basename(path_str))[1]
+        return self._is_text_content(path_str, _lower_suffix(suffix))
+
+    def _is_text_by_name(self, path: PathLike, suffix: str) -> Optional[bool]:
+        """
+        Classify a file as text or binary from its extension alone.
+
+        Args:
+            path: The path to the file.
+            suffix: The lowercased file extension of the path.
+
+        Returns:
+            True or False if the extension decides it, or None if the content
+            has to be sniffed.
+        """
+        is_text = _is_text_suffix(suffix)
+        if is_text is not None and logger.isEnabledFor(logging.DEBUG):
+            if suffix in ALWAYS_TEXT_EXTENSIONS:
+                logger.debug("File is text (by extension override): %s", path)
+            else:
+                mime_type = _mime_for_suffix(suffix)
+                logger.debug("File is %s (mime type: %s): %s", "text" if is_text else "not text", mime_type, path)
         return is_text
 
-    def is_in_excluded_dir(self, path: Path) -> bool:
+    def _is_text_content(self, path: PathLike, suffix: str) -> bool:
+        """
+        Check if an existing regular file is a text file.
+
+        Args:
+            path: The path to the file, already known to be a regular file.
+            suffix: The lowercased file extension of the path.
+
+        Returns:
+            True if the file is a text file, False otherwise.
+        """
+        is_text = self._is_text_by_name(path, suffix)
+        if is_text is not None:
+            return is_text
+
+        # Sniff the start of the file: like git and grep, treat it as
+        # binary if it contains a NUL byte
+        with open(path, "rb") as f:
+            chunk = f.read(TEXT_SNIFF_SIZE)
+        is_text = b"\x00" not in chunk
+        logger.debug("File is %s (NUL byte check): %s", "text" if is_text else "not text", path)
+        return is_text
+
+    def read_if_text(self, path: PathLike) -> Optional[bytes]:
+        """
+        Read a file if it is a text file.
+
+        This performs the same classification as is_text_file, but sniffs the
+        content that is read anyway instead of opening the file twice.
+
+        Args:
+            path: The path to the file.
+
+        Returns:
+            The raw content of the file, or None if it is not a text file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = os.fspath(path)
+        suffix = os.path.splitext(os.path.basename(path))[1]
+        is_text = self._is_text_by_name(path, _lower_suffix(suffix))
+        if is_text is False:
+            return None
+
+        data = read_file_bytes(path)
+
+        if is_text is None and data.find(b"\x00", 0, TEXT_SNIFF_SIZE) != -1:
+            logger.debug("File is not text (NUL byte check): %s", path)
+            return None
+        return data
+
+    def is_in_excluded_dir(self, path: PathLike) -> bool:
         """
         Check if a path is inside an excluded directory.
 
         Args:
-            path: The path to check.
+            path: The path to check, as a string or path-like object.
 
         Returns:
             True if the path is inside an excluded directory, False otherwise.
         """
-        # Convert to absolute path if it's not already
-        abs_path = path if path.is_absolute() else (self.root_path / path).resolve()
+        # Convert to absolute path if it's not already; the root is already
+        # resolved, so joining onto it needs no further normalization
+        path_str = os.fspath(path)
+        if not os.path.isabs(path_str):
+            path_str = os.path.join(self._root_path_str, path_str)
         
         # Check if the path is inside an excluded directory
-        parts = abs_path.parts
-        for exclude_dir in self.DEFAULT_EXCLUDE_DIRS:
-            if exclude_dir in parts:
-                logger.debug(f"File is in excluded directory '{exclude_dir}': {path}")
-                return True
-                
+        if _has_excluded_dir_component(path_str):
+            logger.debug("File is in an excluded directory: %s", path)
+            return True
         return False
-        
-    def is_excluded_file(self, path: Path) -> bool:
+
+    def is_excluded_file(self, path: PathLike) -> bool:
         """
         Check if a file is in the list of excluded files.
         
         Args:
-            path: The path to check.
+            path: The path to check, as a string or path-like object.
             
         Returns:
             True if the file is excluded, False otherwise.
         """
-        # Check exact filename matches
-        if path.name in self.DEFAULT_EXCLUDE_FILES:
-            logger.debug(f"File is in excluded files list: {path}")
+        if _is_default_excluded_name(os.path.basename(os.fspath(path))):
+            logger.debug("File is in excluded files list: %s", path)
             return True
-            
-        # Check pattern matches (for entries with wildcards)
-        for pattern in self.DEFAULT_EXCLUDE_FILES:
-            if "*" in pattern and path.match(pattern):
-                logger.debug(f"File matches excluded pattern '{pattern}': {path}")
-                return True
-                
         return False
 
-    def create_filter(self) -> FilterFunction:
+    def create_dir_filter(self) -> DirFilterFunction:
+        """
+        Create a filter function for directories.
+
+        The returned function lets a directory walk skip whole subtrees:
+        directories ignored by .gitignore rules, and directories whose name
+        matches an additional exclude pattern without a separator (like
+        "node_modules" or "*.egg-info"). DEFAULT_EXCLUDE_DIRS are pruned by
+        name separately.
+
+        Returns:
+            A function that returns True if a directory should be descended into.
+        """
+        exclude_name_matcher = self._exclude_name_matcher
+        is_dir_ignored = (
+            self.gitignore_manager.is_dir_ignored
+            if self.gitignore_manager is not None and self.gitignore_manager.spec is not None
+            else None
+        )
+        if exclude_name_matcher is None and is_dir_ignored is None:
+            return lambda dir_path: True
+
+        def dir_filter(dir_path: str) -> bool:
+            """Filter function for directories."""
+            if exclude_name_matcher is not None and exclude_name_matcher(os.path.basename(dir_path)):
+                return False
+            return is_dir_ignored is None or not is_dir_ignored(dir_path)
+
+        return dir_filter
+
+    def create_filter(self, check_content: bool = True) -> EntryFilterFunction:
         """
         Create a filter function for files.
 
+        Besides a Path, the returned function accepts an os.DirEntry from the
+        walk, whose cached file type it reuses. It works on plain strings
+        internally and does not build Path objects per file.
+
+        Args:
+            check_content: Whether the filter checks that the file is a text
+                file. Pass False when the caller reads included files with
+                read_if_text, which performs that check on the content it reads.
+
         Returns:
             A function that returns True if a file should be included.
         """
@@ -216,42 +592,96 @@ class FileFilter:
             self.gitignore_manager.get_gitignore_filter() 
             if self.gitignore_manager else lambda _: True
         )
+        # Per-file debug messages are only built when debug logging is enabled
+        # at the time the filter is created
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Bind everything the filter uses to locals, so each call does no
+        # attribute or global lookups
+        root_str = self._root_path_str
+        has_excluded_dir = _has_excluded_dir_component
+        is_default_excluded_name = _is_default_excluded_name
+        exclude_name_matcher = self._exclude_name_matcher
+        exclude_path_matchers = self._exclude_path_matchers
+        is_text_content = self._is_text_content
+        binary_extensions = BINARY_EXTENSIONS
+        lower_suffix = _lower_suffix
+        dir_entry_type = os.DirEntry
+        fspath = os.fspath
+        basename = os.path.basename
+        splitext = os.path.splitext
+        path_join = os.path.join
         
-        def file_filter(path: Path) -> bool:
+        def file_filter(entry: PathLike) -> bool:
             """Filter function for files."""
+            # A DirEntry from os.scandir caches its name and file type, so
+            # checking it is free; other path-likes are stat'ed once
+            if isinstance(entry, dir_entry_type):
+                path = entry.path
+                name = entry.name
+                try:
+                    is_file = entry.is_file()
+                except OSError:
+                    is_file = False
+            else:
+                path = fspath(entry)
+                name = basename(path)
+                try:
+                    is_file = stat.S_ISREG(os.stat(path).st_mode)
+                except OSError:
+                    is_file = False
+
             # Skip directories
-            if not path.is_file():
-                logger.debug(f"Skipping directory: {path}")
+            if not is_file:
+                if debug:
+                    logger.debug("Skipping directory: %s", path)
                 return False
-                
+
+            suffix = lower_suffix(splitext(name)[1])
+
             # Skip files with binary extensions
-            if path.suffix.lower() in self.BINARY_EXTENSIONS:
-                logger.debug(f"Skipping binary file (by extension): {path}")
+            if suffix in binary_extensions:
+                if debug:
+                    logger.debug("Skipping binary file (by extension): %s", path)
                 return False
                 
-            # Skip files in excluded directories (like .git)
-            if self.is_in_excluded_dir(path):
+            # Skip files in excluded directories (like .git). FileIterator
+            # already prunes these during the walk; the check is kept so the
+            # filter stays correct when used on arbitrary paths.
+            if has_excluded_dir(path_join(root_str, path)):
+                if debug:
+                    logger.debug("File is in an excluded directory: %s", path)
                 return False
                 
             # Skip excluded files (like .gitignore)
-            if self.is_excluded_file(path):
+            if is_default_excluded_name(name):
+                if debug:
+                    logger.debug("File is in excluded files list: %s", path)
                 return False
                 
             # Skip files matching exclude patterns
-            for pattern in self.exclude_patterns:
-                if path.match(pattern):
-                    logger.debug(f"File matches exclude pattern '{pattern}': {path}")
+            if exclude_name_matcher is not None and exclude_name_matcher(name):
+                if debug:
+                    logger.debug("File matches an exclude pattern: %s", path)
+                return False
+            for pattern, path_matcher in exclude_path_matchers:
+                if path_matcher(path):
+                    if debug:
+                        logger.debug("File matches exclude pattern '%s': %s", pattern, path)
                     return False
                     
             # Apply gitignore filter
             if not gitignore_filter(path):
-                logger.debug(f"File is excluded by gitignore: {path}")
+                if debug:
+                    logger.debug("File is excluded by gitignore: %s", path)
                 return False
                 
             # Check if it's a text file
-            is_text = self.is_text_file(path)
-            if not is_text:
-                logger.debug(f"File is not a text file: {path}")
+            if not check_content:
+                return True
+            is_text = is_text_content(path, suffix)
+            if debug and not is_text:
+                logger.debug("File is not a text file: %s", path)
             return is_text
         
         return file_filter 
\ No newline at end of file
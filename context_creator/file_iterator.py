@@ -1,78 +1,120 @@
 """Module for iterating over files in a file tree."""
 
 import logging
-import mimetypes
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from types import MappingProxyType
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Union
 
-from context_creator.file_filter import FileFilter
+from context_creator.file_filter import TEXT_SNIFF_SIZE, FileFilter
+from context_creator.file_reader import read_file_bytes
 from context_creator.file_tree_creator import FileTreeCreator
-from context_creator.types import FileInfo, FileTree, FilterFunction, PathLike
+from context_creator.types import (
+    EntryFilterFunction,
+    FileInfo,
+    FilterFunction,
+    PathLike,
+)
 
 # Get logger
 logger = logging.getLogger("context_creator")
 
+# Default number of threads used to filter and read files. The work is
+# dominated by I/O syscalls, which release the GIL.
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum number of files being filtered and read at any time. Bounds the
+# memory held by file contents that have been read but not yet consumed.
+MAX_PENDING_FILES = 64
+
+# Maximum number of files handled by each thread pool task. Submitting files
+# in batches amortizes the per-task cost (future, queue hand-off, locking),
+# which is comparable to the cost of reading a small cached file. Batches are
+# made smaller for large thread pools, so that every thread gets a batch
+# without exceeding MAX_PENDING_FILES.
+READ_BATCH_SIZE = 16
+
+# Map of file extensions to language names. The keys are lowercase.
+EXTENSION_MAP = MappingProxyType({
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".jsx": "jsx",
+    ".tsx": "tsx",
+    ".vue": "vue",
+    ".svelte": "svelte",
+    ".html": "html",
+    ".xml": "xml",
+    ".css": "css",
+    ".scss": "scss",
+    ".json": "json",
+    ".md": "markdown",
+    ".rst": "rst",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "ini",
+    ".txt": "text",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "bash",
+    ".fish": "fish",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".hh": "cpp",
+    ".java": "java",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".scala": "scala",
+    ".sql": "sql",
+    ".r": "r",
+    ".dart": "dart",
+    ".lua": "lua",
+    ".ex": "elixir",
+    ".exs": "elixir",
+    ".erl": "erlang",
+    ".hrl": "erlang",
+    ".clj": "clojure",
+    ".cs": "csharp",
+    ".fs": "fsharp",
+    ".fsx": "fsharp",
+    ".pl": "perl",
+    ".pm": "perl",
+    ".hs": "haskell",
+    ".lhs": "haskell",
+    ".elm": "elm",
+    ".proto": "protobuf",
+})
+
 
 class FileIterator:
     """Class for iterating over files in a file tree."""
 
     # Map of file extensions to language names
-    EXTENSION_MAP = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".jsx": "jsx",
-        ".tsx": "tsx",
-        ".html": "html",
-        ".css": "css",
-        ".scss": "scss",
-        ".json": "json",
-        ".md": "markdown",
-        ".yml": "yaml",
-        ".yaml": "yaml",
-        ".toml": "toml",
-        ".ini": "ini",
-        ".cfg": "ini",
-        ".txt": "text",
-        ".sh": "bash",
-        ".bash": "bash",
-        ".zsh": "bash",
-        ".fish": "fish",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".java": "java",
-        ".go": "go",
-        ".rs": "rust",
-        ".rb": "ruby",
-        ".php": "php",
-        ".swift": "swift",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".scala": "scala",
-        ".sql": "sql",
-        ".r": "r",
-        ".dart": "dart",
-        ".lua": "lua",
-        ".ex": "elixir",
-        ".exs": "elixir",
-        ".erl": "erlang",
-        ".hrl": "erlang",
-        ".clj": "clojure",
-        ".cs": "csharp",
-        ".fs": "fsharp",
-        ".pl": "perl",
-        ".pm": "perl",
-        ".hs": "haskell",
-        ".lhs": "haskell",
-    }
+    EXTENSION_MAP = EXTENSION_MAP
 
     def __init__(
         self,
         root_dir: PathLike,
         file_filter: Optional[FilterFunction] = None,
         additional_exclude_patterns: List[str] = None,
+        max_workers: Optional[int] = None,
+        use_gitignore: bool = True,
     ):
         """
         Initialize the FileIterator.
@@ -81,42 +123,88 @@ class FileIterator:
             root_dir: The root directory to scan.
             file_filter: A function that returns True if a file should be included.
             additional_exclude_patterns: Additional patterns to exclude.
+            max_workers: Number of threads used to filter and read files.
+            use_gitignore: Whether the default file filter uses .gitignore rules.
         """
         self.root_path = Path(root_dir).resolve()
+        self.root_path_str = str(self.root_path)
+        # Every walked path starts with this prefix, so slicing it off gives
+        # the relative path without any Path parsing
+        self._root_prefix_len = len(os.path.join(self.root_path_str, ""))
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
         logger.debug(f"Initializing FileIterator for directory: {self.root_path}")
         
-        # Create a file filter if not provided
+        # Create a file filter if not provided. The text check is then left to
+        # FileFilter.read_if_text, so each included file is opened only once.
+        # The default filter also takes DirEntry objects, so it is kept as
+        # _entry_filter too.
+        self.filter_manager: Optional[FileFilter] = None
+        self._entry_filter: Optional[EntryFilterFunction] = None
+        self.file_filter: FilterFunction
         if file_filter is None:
             logger.debug("Creating default file filter")
-            filter_manager = FileFilter(
+            self.filter_manager = FileFilter(
                 self.root_path, 
-                use_gitignore=True,
+                use_gitignore=use_gitignore,
                 additional_exclude_patterns=additional_exclude_patterns,
             )
-            self.file_filter = filter_manager.create_filter()
+            self._entry_filter = self.filter_manager.create_filter(check_content=False)
+            self.file_filter = self._entry_filter
         else:
             logger.debug("Using provided file filter")
             self.file_filter = file_filter
         
-        # Create a file tree creator
-        self.tree_creator = FileTreeCreator(self.root_path)
+        # Create a file tree creator that prunes excluded directories (like
+        # .git) and, with the default filter, gitignored directories during
+        # the walk instead of filtering each file inside them
+        self.tree_creator = FileTreeCreator(
+            self.root_path,
+            exclude_dirs=FileFilter.DEFAULT_EXCLUDE_DIRS,
+            max_workers=self.max_workers,
+            dir_filter=(
+                self.filter_manager.create_dir_filter()
+                if self.filter_manager is not None else None
+            ),
+        )
 
-    def get_file_type(self, path: Path) -> str:
+    def get_file_type(self, path: Union[str, Path]) -> str:
         """
         Get the file type (language) based on the file extension.
 
         Args:
-            path: The path to the file.
+            path: The path to the file, or the file name as a string.
 
         Returns:
             The file type as a string.
         """
-        extension = path.suffix.lower()
-        file_type = self.EXTENSION_MAP.get(extension, "text")
-        logger.debug(f"File type for {path.name}: {file_type}")
+        name = path if isinstance(path, str) else path.name
+        dot = name.rfind(".")
+        if dot <= 0:
+            return "text"
+        
+        # The map keys are lowercase, so only lowercase on a miss
+        extension = name[dot:]
+        file_type = EXTENSION_MAP.get(extension) or EXTENSION_MAP.get(extension.lower(), "text")
         return file_type
 
-    def read_file_content(self, path: Path) -> str:
+    def decode_content(self, data: bytes) -> str:
+        """
+        Decode the raw content of a file.
+
+        Args:
+            data: The raw content of the file.
+
+        Returns:
+            The content decoded as UTF-8, or as Latin-1 if it is not valid UTF-8.
+        """
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            # Latin-1 can decode any byte sequence
+            logger.debug("UTF-8 decode error, falling back to Latin-1")
+            return data.decode("latin-1")
+
+    def read_file_content(self, path: Path) -> Optional[str]:
         """
         Read the content of a file.
 
@@ -124,73 +212,184 @@ class FileIterator:
             path: The path to the file.
 
         Returns:
-            The content of the file as a string.
+            The content of the file as a string, or None if the file turns out
+            to be binary.
         """
-        logger.debug(f"Reading file content: {path}")
+        logger.debug("Reading file content: %s", path)
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-                logger.debug(f"Read {len(content)} characters from {path}")
-                return content
-        except UnicodeDecodeError:
-            logger.debug(f"UTF-8 decode error for {path}, trying Latin-1")
-            # If UTF-8 fails, try with Latin-1 (which can read any byte sequence)
-            with open(path, "r", encoding="latin-1") as f:
-                content = f.read()
-                logger.debug(f"Read {len(content)} characters from {path} using Latin-1")
-                return content
+            data = read_file_bytes(path)
         except Exception as e:
-            logger.warning(f"Error reading file {path}: {e}")
+            logger.warning("Error reading file %s: %s", path, e)
             return f"[Error reading file: {e}]"
+        
+        # Like git, treat the file as binary if its start contains a NUL byte,
+        # instead of embedding it decoded as Latin-1
+        if data.find(b"\x00", 0, TEXT_SNIFF_SIZE) != -1:
+            logger.debug("File is not text (NUL byte check): %s", path)
+            return None
+        
+        content = self.decode_content(data)
+        logger.debug("Read %d characters from %s", len(content), path)
+        return content
 
-    def iterate_files(self) -> Iterator[FileInfo]:
+    def load_file(self, entry: os.DirEntry) -> Optional[FileInfo]:
+        """
+        Filter a single directory entry and read it if it is included.
+
+        Args:
+            entry: The directory entry of the file.
+
+        Returns:
+            A FileInfo object, or None if the file is excluded.
+        """
+        # Skip files that don't pass the filter. The default filter takes the
+        # DirEntry itself and reuses its cached file type; custom filters are
+        # given a Path, as they always have been.
+        if self._entry_filter is not None:
+            is_included = self._entry_filter(entry)
+        else:
+            is_included = self.file_filter(Path(entry.path))
+        if not is_included:
+            logger.debug("Excluding file: %s", entry.path)
+            return None
+        
+        # Only build Paths for files that end up in a FileInfo
+        file_path = Path(entry.path)
+        
+        # Get the relative path from the root directory
+        relative_path = Path(entry.path[self._root_prefix_len:])
+        
+        # Read the file content, checking that it is text if the filter left
+        # that to us
+        if self.filter_manager is None:
+            content = self.read_file_content(file_path)
+            if content is None:
+                logger.debug("Excluding non-text file: %s", relative_path)
+                return None
+        else:
+            try:
+                data = self.filter_manager.read_if_text(file_path)
+            except Exception as e:
+                logger.warning("Error reading file %s: %s", file_path, e)
+                content = f"[Error reading file: {e}]"
+            else:
+                if data is None:
+                    logger.debug("Excluding non-text file: %s", relative_path)
+                    return None
+                content = self.decode_content(data)
+        logger.debug("Including file: %s", relative_path)
+        
+        # Get the file type
+        file_type = self.get_file_type(entry.name)
+        
+        return FileInfo(
+            path=file_path,
+            relative_path=relative_path,
+            content=content,
+            file_type=file_type,
+        )
+
+    def load_files(self, entries: List[os.DirEntry]) -> List[Optional[FileInfo]]:
+        """
+        Filter and read a batch of directory entries.
+
+        Args:
+            entries: The directory entries of the files.
+
+        Returns:
+            A FileInfo object, or None if the file is excluded, for each entry.
+        """
+        return [self.load_file(entry) for entry in entries]
+
+    def _iter_batches(
+        self, entries: Iterable[os.DirEntry], batch_size: int
+    ) -> Iterator[List[os.DirEntry]]:
+        """
+        Group directory entries into batches.
+
+        Args:
+            entries: The directory entries of the files.
+            batch_size: The number of entries in each batch.
+
+        Yields:
+            Lists of at most batch_size entries.
+        """
+        batch: List[os.DirEntry] = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def iterate_files(self, sort: bool = False) -> Iterator[FileInfo]:
         """
         Iterate over files in the root directory.
 
+        Filtering (including any content sniffing) and reading are done on a
+        thread pool so that the I/O for many files overlaps. At most
+        MAX_PENDING_FILES files are in flight at once, and FileInfo objects
+        are yielded as their reads complete.
+
+        Args:
+            sort: Whether to yield files ordered by relative path. The walk is
+                then finished and sorted before any file is read, and files
+                are yielded in order while later ones are still being read.
+
         Yields:
             FileInfo objects for each file.
         """
         logger.debug(f"Iterating over files in {self.root_path}")
         
-        # Create a file tree
-        file_tree = self.tree_creator.create_file_tree()
-        
-        # Count total files for logging
-        total_files = sum(len(files) for files in file_tree.values())
         included_files = 0
         excluded_files = 0
         
-        logger.debug(f"Found {total_files} total files in the file tree")
+        def collect(done: Iterable["Future[List[Optional[FileInfo]]]"]) -> Iterator[FileInfo]:
+            nonlocal included_files, excluded_files
+            for future in done:
+                for file_info in future.result():
+                    if file_info is None:
+                        excluded_files += 1
+                    else:
+                        included_files += 1
+                        yield file_info
+        
+        # Walk the tree with os.scandir, passing each DirEntry to the filter so
+        # that its cached file type can be reused. Only the entries are sorted;
+        # the walk holds no file contents.
+        entries: Iterable[os.DirEntry] = self.tree_creator.iter_files()
+        if sort:
+            prefix_len = self._root_prefix_len
+            entries = sorted(entries, key=lambda entry: entry.path[prefix_len:])
         
-        # Iterate over all files in the tree
-        for dir_path, files in file_tree.items():
-            logger.debug(f"Processing directory: {dir_path.relative_to(self.root_path) if dir_path != self.root_path else '.'} ({len(files)} files)")
-            
-            for file_path in files:
-                # Skip files that don't pass the filter
-                if not self.file_filter(file_path):
-                    excluded_files += 1
-                    logger.debug(f"Excluding file: {file_path.relative_to(self.root_path)}")
-                    continue
-                    
-                included_files += 1
-                
-                # Get the relative path from the root directory
-                relative_path = file_path.relative_to(self.root_path)
-                logger.debug(f"Including file: {relative_path}")
-                
-                # Read the file content
-                content = self.read_file_content(file_path)
-                
-                # Get the file type
-                file_type = self.get_file_type(file_path)
-                
-                # Yield a FileInfo object
-                yield FileInfo(
-                    path=file_path,
-                    relative_path=relative_path,
-                    content=content,
-                    file_type=file_type,
-                )
+        # Entries are handed to the pool in batches of up to READ_BATCH_SIZE.
+        # Batches shrink for large pools, so that MAX_PENDING_FILES files still
+        # give every thread a batch and no thread sits idle
+        batch_size = max(
+            1, min(READ_BATCH_SIZE, MAX_PENDING_FILES // self.max_workers)
+        )
+        max_pending_batches = max(1, MAX_PENDING_FILES // batch_size)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if sort:
+                # Collect batches in submission order
+                queued: Deque["Future[List[Optional[FileInfo]]]"] = deque()
+                for batch in self._iter_batches(entries, batch_size):
+                    queued.append(executor.submit(self.load_files, batch))
+                    if len(queued) >= max_pending_batches:
+                        yield from collect([queued.popleft()])
+                while queued:
+                    yield from collect([queued.popleft()])
+            else:
+                # Collect batches as they complete
+                pending: Set["Future[List[Optional[FileInfo]]]"] = set()
+                for batch in self._iter_batches(entries, batch_size):
+                    pending.add(executor.submit(self.load_files, batch))
+                    if len(pending) >= max_pending_batches:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from collect(done)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from collect(done)
         
         logger.debug(f"Iteration complete. Included {included_files} files, excluded {excluded_files} files") 
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Module for reading raw file contents with as few syscalls as possible."""
+
+import errno
+import logging
+import os
+
+from context_creator.types import PathLike
+
+# Get logger
+logger = logging.getLogger("context_creator")
+
+# Smallest size of each read when the file size is unknown or the first read
+# came back short
+READ_CHUNK_SIZE = 64 * 1024
+
+# Open flags for reading raw bytes (O_BINARY only exists on Windows). The
+# descriptors never need to survive an exec, so they are opened close-on-exec.
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+# On Linux, O_NOATIME keeps reads from updating access times. The kernel only
+# allows it for files owned by the caller (or with CAP_FOWNER); after the first
+# EPERM it is no longer tried, so files of other users cost no extra syscall.
+_NOATIME_FLAG = getattr(os, "O_NOATIME", 0)
+_use_noatime = bool(_NOATIME_FLAG)
+
+
+def _open_for_reading(path: PathLike) -> int:
+    """
+    Open a file for reading raw bytes.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The file descriptor.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    global _use_noatime
+    if _use_noatime:
+        try:
+            return os.open(path, _OPEN_FLAGS | _NOATIME_FLAG)
+        except PermissionError as e:
+            if e.errno != errno.EPERM:
+                raise
+            _use_noatime = False
+    return os.open(path, _OPEN_FLAGS)
+
+
+def read_file_bytes(path: PathLike) -> bytes:
+    """
+    Read the whole content of a file as bytes.
+
+    The file is read with os.read() calls sized from its stat size, rather
+    than through the buffered io layer, so a typical file costs one open,
+    one fstat, two reads (the second one returning EOF) and one close.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The content of the file.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    fd = _open_for_reading(path)
+    try:
+        # Ask for one byte more than expected, so a file that has not changed
+        # is read in one call. Files reporting a size of 0 (e.g. in /proc)
+        # are read in chunks.
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1 if size > 0 else READ_CHUNK_SIZE)
+        if not data:
+            return data
+
+        # A short read does not mean EOF: a single read is capped (at about
+        # 2 GiB on Linux), and the file may have grown. Read until os.read()
+        # returns nothing.
+        chunks = [data]
+        remaining = size - len(data)
+        while True:
+            chunk = os.read(fd, max(remaining, READ_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return data if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
\ No newline at end of file
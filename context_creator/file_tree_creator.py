@@ -2,10 +2,12 @@
 
 import logging
 import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from context_creator.types import FileTree, PathLike
+from context_creator.types import DirFilterFunction, FileTree, PathLike
 
 # Get logger
 logger = logging.getLogger("context_creator")
@@ -14,21 +16,37 @@ logger = logging.getLogger("context_creator")
 class FileTreeCreator:
     """Class for creating a file tree from a directory."""
 
-    def __init__(self, root_dir: PathLike):
+    def __init__(
+        self,
+        root_dir: PathLike,
+        exclude_dirs: Optional[Iterable[str]] = None,
+        max_workers: int = 1,
+        dir_filter: Optional[DirFilterFunction] = None,
+    ):
         """
         Initialize the FileTreeCreator.
 
         Args:
             root_dir: The root directory to scan.
+            exclude_dirs: Directory names that iter_files should not descend into.
+            max_workers: Number of threads iter_files uses to scan directories.
+            dir_filter: A function that returns False for directories that
+                should not be descended into, given their absolute path.
         """
         self.root_path = Path(root_dir).resolve()
+        self.exclude_dirs = frozenset(exclude_dirs or ())
+        self.max_workers = max_workers
+        self.dir_filter = dir_filter
         
         logger.debug(f"Initializing FileTreeCreator for directory: {self.root_path}")
         
-        if not self.root_path.exists():
+        # Check the root with a single stat instead of exists() and is_dir()
+        try:
+            root_mode = os.stat(self.root_path).st_mode
+        except OSError:
             logger.error(f"Directory not found: {self.root_path}")
             raise FileNotFoundError(f"Directory not found: {self.root_path}")
-        if not self.root_path.is_dir():
+        if not stat.S_ISDIR(root_mode):
             logger.error(f"Not a directory: {self.root_path}")
             raise NotADirectoryError(f"Not a directory: {self.root_path}")
 
@@ -37,25 +55,146 @@ class FileTreeCreator:
         Create a file tree from the root directory.
 
         Returns:
-            A dictionary mapping directories to lists of files.
+            A dictionary mapping directory paths to lists of file paths, all
+            as absolute path strings.
         """
         logger.debug(f"Creating file tree for directory: {self.root_path}")
         
         file_tree: FileTree = {}
-        total_dirs = 0
         total_files = 0
 
-        for dirpath, dirnames, filenames in os.walk(self.root_path):
-            dir_path = Path(dirpath)
-            total_dirs += 1
-            
+        for dir_path, file_paths in self.walk():
             # Add files to the file tree
-            file_paths = [dir_path / filename for filename in filenames]
             file_tree[dir_path] = file_paths
             total_files += len(file_paths)
-            
-            rel_path = dir_path.relative_to(self.root_path) if dir_path != self.root_path else Path(".")
-            logger.debug(f"Found directory: {rel_path} with {len(file_paths)} files")
 
-        logger.debug(f"File tree created with {total_dirs} directories and {total_files} files")
-        return file_tree 
\ No newline at end of file
+        logger.debug(f"File tree created with {len(file_tree)} directories and {total_files} files")
+        return file_tree
+
+    @staticmethod
+    def as_paths(file_tree: FileTree) -> Dict[Path, List[Path]]:
+        """
+        Convert a file tree of path strings into one of Path objects.
+
+        The walk works on strings throughout; this is for callers that want
+        Path objects and only pays for them when asked.
+
+        Args:
+            file_tree: A file tree as returned by create_file_tree.
+
+        Returns:
+            The same tree with directory and file paths as Path objects.
+        """
+        return {
+            Path(dir_path): [Path(file_path) for file_path in file_paths]
+            for dir_path, file_paths in file_tree.items()
+        }
+
+    def walk(self) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Walk the directory tree one directory at a time.
+
+        Unlike create_file_tree, this does not hold the whole tree in memory;
+        only the directories still to be scanned are kept.
+
+        Yields:
+            The path of each directory and the paths of the files it contains,
+            all as absolute path strings.
+        """
+        for dir_path, files in self._iter_dirs():
+            file_paths = [entry.path for entry in files]
+            logger.debug("Found directory: %s with %d files", dir_path, len(file_paths))
+            yield dir_path, file_paths
+
+    def _scan_dir(self, dir_path: str) -> Tuple[List[os.DirEntry], List[str]]:
+        """
+        Scan a single directory.
+
+        Args:
+            dir_path: The directory to scan.
+
+        Returns:
+            The non-directory entries of the directory, and the paths of the
+            subdirectories to descend into.
+        """
+        files: List[os.DirEntry] = []
+        subdirs: List[str] = []
+        dir_filter = self.dir_filter
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are neither
+                        # followed nor reported as files
+                        if entry.is_symlink():
+                            continue
+                        # Prune excluded directories without scanning them
+                        if entry.name in self.exclude_dirs:
+                            logger.debug("Skipping excluded directory: %s", entry.path)
+                            continue
+                        if dir_filter is not None and not dir_filter(entry.path):
+                            logger.debug("Skipping filtered directory: %s", entry.path)
+                            continue
+                        subdirs.append(entry.path)
+                    else:
+                        files.append(entry)
+        except OSError as e:
+            logger.warning(f"Error scanning directory {dir_path}: {e}")
+        return files, subdirs
+
+    def _iter_dirs(self) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+        """
+        Scan every directory below the root directory, including the root.
+
+        With max_workers > 1, directories are scanned concurrently on a
+        thread pool (os.scandir releases the GIL), and are yielded in the
+        order they finish scanning.
+
+        Yields:
+            The path of each directory and its non-directory entries.
+        """
+        root = str(self.root_path)
+        if self.max_workers <= 1:
+            stack = [root]
+            while stack:
+                dir_path = stack.pop()
+                files, subdirs = self._scan_dir(dir_path)
+                stack.extend(subdirs)
+                yield dir_path, files
+            return
+
+        # Each task scans one directory; the subdirectories it finds are
+        # submitted as new tasks until no scans are pending. At most
+        # max_workers directories are open at any time.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_dir, root): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_path = pending.pop(future)
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending[executor.submit(self._scan_dir, subdir)] = subdir
+                    yield dir_path, files
+
+    def iter_files(self) -> Iterator[os.DirEntry]:
+        """
+        Iterate over all non-directory entries below the root directory.
+
+        Unlike create_file_tree, this yields the os.DirEntry objects produced
+        by os.scandir, whose is_file()/is_dir() results are cached from the
+        directory listing and therefore cost no extra stat calls. Directories
+        named in exclude_dirs or rejected by dir_filter are never descended
+        into.
+
+        With max_workers > 1, directories are scanned concurrently on a
+        thread pool, and entries are yielded in the order their directories
+        finish scanning.
+
+        Yields:
+            An os.DirEntry for each non-directory entry.
+        """
+        logger.debug(f"Scanning directory tree: {self.root_path}")
+
+        for _, files in self._iter_dirs():
+            yield from files
\ No newline at end of file
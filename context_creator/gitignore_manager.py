@@ -1,17 +1,55 @@
 """Module for managing .gitignore files and filtering files based on gitignore rules."""
 
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Callable, Optional
-
-import gitignore_parser
+from typing import TYPE_CHECKING, Dict, Optional
 
 from context_creator.types import FilterFunction, PathLike
 
 # Get logger
 logger = logging.getLogger("context_creator")
 
+if TYPE_CHECKING:
+    import pathspec
+
+
+@functools.lru_cache(maxsize=32)
+def _load_gitignore_spec(gitignore_path: str, mtime_ns: int, size: int) -> "pathspec.GitIgnoreSpec":
+    """
+    Parse a .gitignore file.
+
+    Cached so that GitignoreManager instances for the same directory share
+    the compiled rules. The modification time and size are part of the key,
+    so an edited file is parsed again.
+
+    Args:
+        gitignore_path: The path to the .gitignore file.
+        mtime_ns: The modification time of the file, in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        The compiled rules, matched against relative POSIX-style paths.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    # pathspec takes longer to import than the rest of the package, so it is
+    # only imported for projects that have a .gitignore
+    import pathspec
+
+    with open(gitignore_path, "r") as f:
+        lines = f.read().splitlines()
+    spec = pathspec.GitIgnoreSpec.from_lines(lines)
+    
+    # Log the contents of the .gitignore file
+    non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith("#")]
+    logger.debug(f".gitignore contains {len(non_empty_lines)} non-empty, non-comment lines")
+    for line in non_empty_lines:
+        logger.debug(f"  .gitignore pattern: {line}")
+    return spec
+
 
 class GitignoreManager:
     """Class for managing .gitignore files and filtering files based on gitignore rules."""
@@ -24,56 +62,140 @@ class GitignoreManager:
             root_dir: The root directory containing the .gitignore file.
         """
         self.root_path = Path(root_dir).resolve()
+        self.root_path_str = str(self.root_path)
+        # Paths below the root start with this prefix, so slicing it off gives
+        # the relative path that the rules are matched against
+        self._root_prefix = os.path.join(self.root_path_str, "")
         self.gitignore_path = self.root_path / ".gitignore"
-        self.matches = None
+        self.spec: Optional["pathspec.GitIgnoreSpec"] = None
+        self._gitignore_filter: Optional[FilterFunction] = None
+        # Whether each directory seen so far is ignored, itself or through an
+        # ignored ancestor
+        self._dir_cache: Dict[str, bool] = {}
         
         logger.debug(f"Initializing GitignoreManager for directory: {self.root_path}")
         
-        if self.gitignore_path.exists():
+        try:
+            st = os.stat(self.gitignore_path)
+        except OSError:
+            logger.debug("No .gitignore file found")
+        else:
             logger.debug(f"Found .gitignore file: {self.gitignore_path}")
-            # Parse the .gitignore file
-            self.matches = gitignore_parser.parse_gitignore(self.gitignore_path)
-            
-            # Log the contents of the .gitignore file
+            # Parse the .gitignore file, or reuse the rules parsed for it before
             try:
-                with open(self.gitignore_path, "r") as f:
-                    content = f.read().strip()
-                    lines = content.split("\n")
-                    non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith("#")]
-                    logger.debug(f".gitignore contains {len(non_empty_lines)} non-empty, non-comment lines")
-                    for line in non_empty_lines:
-                        logger.debug(f"  .gitignore pattern: {line}")
+                self.spec = _load_gitignore_spec(str(self.gitignore_path), st.st_mtime_ns, st.st_size)
             except Exception as e:
                 logger.warning(f"Error reading .gitignore file: {e}")
-        else:
-            logger.debug("No .gitignore file found")
+
+    def _relative_path(self, abs_path: str) -> Optional[str]:
+        """
+        Get the path relative to the root directory in the form the rules expect.
+
+        Args:
+            abs_path: The absolute path, as a string.
+
+        Returns:
+            The relative path with "/" separators, or None if the path is not
+            below the root directory.
+        """
+        if not abs_path.startswith(self._root_prefix):
+            return None
+        rel_path = abs_path[len(self._root_prefix):]
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        return rel_path
+
+    def is_dir_ignored(self, dir_path: str) -> bool:
+        """
+        Check whether a directory is ignored by .gitignore rules.
+
+        A directory is ignored if it matches a rule itself or lies inside an
+        ignored directory; as in git, files below an ignored directory cannot
+        be re-included. Results are memoized per directory, so each directory
+        is matched against the rules at most once.
+
+        Args:
+            dir_path: The absolute path of the directory, as a string.
+
+        Returns:
+            True if the directory is ignored.
+        """
+        is_ignored = self._dir_cache.get(dir_path)
+        if is_ignored is None:
+            spec = self.spec
+            rel_path = self._relative_path(dir_path) if spec is not None else None
+            if spec is None or not rel_path:
+                # Without rules nothing is ignored, and the root directory and
+                # anything outside it are never ignored
+                is_ignored = False
+            else:
+                # The trailing slash lets directory-only rules like "build/" match
+                is_ignored = (
+                    self.is_dir_ignored(os.path.dirname(dir_path))
+                    or spec.match_file(rel_path + "/")
+                )
+            self._dir_cache[dir_path] = is_ignored
+        return is_ignored
 
     def get_gitignore_filter(self) -> FilterFunction:
         """
         Create a filter function based on .gitignore rules.
 
+        The filter is built once per GitignoreManager and reused by later
+        calls, so all callers share the same parsed rules.
+
+        Returns:
+            A function that returns True if a file should be included (not ignored).
+        """
+        if self._gitignore_filter is None:
+            self._gitignore_filter = self._create_gitignore_filter()
+        return self._gitignore_filter
+
+    def _create_gitignore_filter(self) -> FilterFunction:
+        """
+        Build the filter function returned by get_gitignore_filter.
+
         Returns:
             A function that returns True if a file should be included (not ignored).
         """
         logger.debug("Creating gitignore filter function")
         
-        if self.matches is None:
+        if self.spec is None:
             # If no .gitignore file exists, include all files
             logger.debug("No gitignore rules, including all files")
             return lambda path: True
 
+        # Bind the compiled rules and root once, so each call is a single match
+        match_file = self.spec.match_file
+        root_path_str = self.root_path_str
+        relative_path = self._relative_path
+        is_dir_ignored = self.is_dir_ignored
+
         # Create a filter function that returns True if a file should be included
-        def gitignore_filter(path: Path) -> bool:
+        def gitignore_filter(path: PathLike) -> bool:
             """Filter function for gitignore rules."""
-            # Convert to absolute path if it's not already
-            abs_path = path if path.is_absolute() else (self.root_path / path).resolve()
+            # Convert to absolute path if it's not already. Walked paths are
+            # already absolute and canonical under the resolved root, so they
+            # are used as is; relative paths only need lexical normalization
+            # (of "." and ".." components), which needs no syscalls
+            path_str = os.fspath(path)
+            if os.path.isabs(path_str):
+                abs_path = path_str
+            else:
+                abs_path = os.path.normpath(os.path.join(root_path_str, path_str))
+            
+            # Files outside the root directory are not covered by its rules
+            rel_path = relative_path(abs_path)
+            if rel_path is None:
+                return True
             
-            # Check if the file is ignored by gitignore
-            is_ignored = self.matches(str(abs_path))
+            # Check if the file is ignored by gitignore. Files inside an ignored
+            # directory are rejected from the memoized directory result
+            # without evaluating the rules against the file path.
+            is_ignored = is_dir_ignored(os.path.dirname(abs_path)) or match_file(rel_path)
             
-            if is_ignored:
-                rel_path = path.relative_to(self.root_path) if path.is_absolute() else path
-                logger.debug(f"File is ignored by gitignore: {rel_path}")
+            if is_ignored and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File is ignored by gitignore: %s", rel_path)
                 
             # Return True if the file should be included (not matched by gitignore)
             return not is_ignored
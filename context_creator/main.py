@@ -1,13 +1,13 @@
 """Main entry point for the Context Creator command-line tool."""
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 from context_creator.context_creator import ContextCreator
-from context_creator.file_filter import FileFilter
 from context_creator.types import PathLike
 
 # Configure logging
@@ -32,15 +32,15 @@ def setup_logging(verbose: bool = False):
         logger.setLevel(logging.INFO)
 
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
-    Args:
-        args: Command-line arguments. If None, sys.argv[1:] is used.
+    The parser is built once and reused by later calls to parse_args.
 
     Returns:
-        An argparse.Namespace object containing the parsed arguments.
+        The argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Create context for LLMs from a development project."
@@ -59,8 +59,12 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--exclude",
         action="append",
-        default=[],
-        help="Additional patterns to exclude (can be specified multiple times)",
+        # The parser is cached, so a list default would be shared between calls
+        default=None,
+        help=(
+            "Additional patterns to exclude (can be specified multiple times); "
+            "patterns without a '/' also exclude matching directories"
+        ),
     )
     parser.add_argument(
         "--no-clipboard",
@@ -79,7 +83,23 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Enable verbose logging",
     )
     
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        args: Command-line arguments. If None, sys.argv[1:] is used.
+
+    Returns:
+        An argparse.Namespace object containing the parsed arguments.
+    """
+    parsed_args = _build_parser().parse_args(args)
+    if parsed_args.exclude is None:
+        parsed_args.exclude = []
+    return parsed_args
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -100,19 +120,22 @@ def main(args: Optional[List[str]] = None) -> int:
     try:
         logger.info(f"Scanning directory: {parsed_args.directory}")
         
-        # Create a file filter
-        file_filter = FileFilter(
-            parsed_args.directory,
-            use_gitignore=not parsed_args.no_gitignore,
-            additional_exclude_patterns=parsed_args.exclude,
-        ).create_filter()
-        
-        # Create a context creator
+        # Create a context creator; it builds its own file filter so that
+        # files are classified and read in a single pass
         context_creator = ContextCreator(
             root_dir=parsed_args.directory,
-            file_filter=file_filter,
+            additional_exclude_patterns=parsed_args.exclude,
+            use_gitignore=not parsed_args.no_gitignore,
         )
         
+        # Without the clipboard, nothing needs the whole context at once, so
+        # stream it straight into the output file
+        if parsed_args.output and parsed_args.no_clipboard:
+            with open(parsed_args.output, "w", encoding="utf-8") as f:
+                context_creator.write_context(f)
+            print(f"Context written to {parsed_args.output}")
+            return 0
+        
         # Create context
         context = context_creator.create_context(
             copy_to_clipboard=not parsed_args.no_clipboard,
@@ -122,14 +145,17 @@ def main(args: Optional[List[str]] = None) -> int:
         if parsed_args.output:
             with open(parsed_args.output, "w", encoding="utf-8") as f:
                 f.write(context)
-            logger.info(f"Context written to {parsed_args.output}")
+            print(f"Context written to {parsed_args.output}")
         # Output to stdout if no clipboard and no output file
         elif parsed_args.no_clipboard:
             print(context)
+        
+        # Make sure the background clipboard copy finishes before exiting
+        context_creator.wait_for_clipboard()
             
         return 0
     except Exception as e:
-        logger.error(f"Error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
         if parsed_args.verbose:
             logger.exception("Detailed error information:")
         return 1
@@ -1,11 +1,17 @@
 """Type definitions for the Context Creator package."""
 
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Union
 
+# One FileInfo is created per included file, so it uses __slots__ where
+# dataclasses support it (Python 3.10+) to avoid a per-instance __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileInfo:
     """Information about a file in the project."""
 
@@ -16,6 +22,12 @@ class FileInfo:
 
 
 # Type aliases
+PathLike = Union[str, os.PathLike]
+# Filter functions take the Path of a file and return True to include it
 FilterFunction = Callable[[Path], bool]
-PathLike = Union[str, Path]
-FileTree = Dict[Path, List[Path]] 
\ No newline at end of file
+# The default file filter also takes the os.DirEntry objects of the walk
+EntryFilterFunction = Callable[[Union[os.DirEntry, PathLike]], bool]
+# Directory filters take an absolute directory path and return True to descend
+DirFilterFunction = Callable[[str], bool]
+# Maps directory paths to the paths of the files they contain, as strings
+FileTree = Dict[str, List[str]] 
\ No newline at end of file
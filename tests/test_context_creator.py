@@ -1,5 +1,7 @@
 """Tests for the ContextCreator class."""
 
+import io
+import logging
 import os
 import tempfile
 from pathlib import Path
@@ -33,7 +35,7 @@ def test_format_file_info():
 
 
 @patch("pyperclip.copy")
-def test_create_context(mock_copy):
+def test_create_context(mock_copy, caplog):
     """Test creating context from files."""
     with tempfile.TemporaryDirectory() as temp_dir:
         # Create some files
@@ -56,8 +58,9 @@ def test_create_context(mock_copy):
         )
         
         # Create context
-        with patch("builtins.print") as mock_print:
+        with caplog.at_level(logging.INFO, logger="context_creator"):
             context = creator.create_context(copy_to_clipboard=True)
+            creator.wait_for_clipboard()
         
         # Check that the context contains all files
         assert "file1.py:" in context
@@ -73,8 +76,11 @@ def test_create_context(mock_copy):
         # Check that the context was copied to the clipboard
         mock_copy.assert_called_once_with(context)
         
-        # Check that a message was printed
-        mock_print.assert_called_once()
+        # Check that the copy was logged
+        assert any(
+            record.levelno == logging.INFO and record.getMessage().startswith("Context copied to clipboard")
+            for record in caplog.records
+        )
 
 
 @patch("pyperclip.copy")
@@ -101,4 +107,59 @@ def test_create_context_no_clipboard(mock_copy):
         assert "test content" in context
         
         # Check that the context was not copied to the clipboard
-        mock_copy.assert_not_called() 
\ No newline at end of file
+        mock_copy.assert_not_called()
+
+
+def test_write_file_info():
+    """Test that writing a FileInfo object matches its formatted string."""
+    file_info = FileInfo(
+        path=Path("/path/to/file.py"),
+        relative_path=Path("file.py"),
+        content="def hello():\n    print('Hello, world!')",
+        file_type="python",
+    )
+    creator = ContextCreator(".")
+    
+    # Write the FileInfo object to a buffer
+    buf = io.StringIO()
+    creator.write_file_info(buf, file_info)
+    
+    assert buf.getvalue() == creator.format_file_info(file_info)
+
+
+@patch("pyperclip.copy", side_effect=RuntimeError("no clipboard"))
+def test_wait_for_clipboard_raises_copy_error(mock_copy):
+    """Test that an error from the background clipboard copy is re-raised."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a ContextCreator instance for an empty directory
+        creator = ContextCreator(temp_dir, file_filter=lambda path: True)
+        creator.create_context(copy_to_clipboard=True)
+        
+        # The error is raised when waiting for the copy to finish
+        with pytest.raises(RuntimeError, match="no clipboard"):
+            creator.wait_for_clipboard()
+
+
+@patch("pyperclip.copy")
+def test_write_context(mock_copy):
+    """Test writing the context to a stream in order of the file paths."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create some files
+        for rel_path in ("b.txt", "a.txt", os.path.join("sub", "c.txt")):
+            abs_path = os.path.join(temp_dir, rel_path)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            with open(abs_path, "w") as f:
+                f.write(f"content of {rel_path}")
+        
+        # Create a ContextCreator instance
+        creator = ContextCreator(temp_dir)
+        
+        # Write the context to a stream
+        out = io.StringIO()
+        num_files = creator.write_context(out)
+        
+        # Check that the stream holds the same context as create_context
+        assert num_files == 3
+        assert out.getvalue() == creator.create_context(copy_to_clipboard=False)
+        assert out.getvalue().index("a.txt:") < out.getvalue().index("b.txt:")
+        mock_copy.assert_not_called()
@@ -239,4 +239,93 @@ def test_create_filter_with_always_text_extensions():
             # The files should still pass the filter because of their extensions
             assert filter_func(Path(rust_file)), "Rust file should pass the filter"
             assert filter_func(Path(go_file)), "Go file should pass the filter"
-            assert filter_func(Path(typescript_file)), "TypeScript file should pass the filter" 
\ No newline at end of file
+            assert filter_func(Path(typescript_file)), "TypeScript file should pass the filter"
+
+
+def test_create_filter_with_path_exclude_patterns():
+    """Test that exclude patterns containing a separator match against the path."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create files with the same name in different directories
+        subdir = os.path.join(temp_dir, "subdir")
+        os.makedirs(subdir)
+        root_file = os.path.join(temp_dir, "notes.txt")
+        sub_file = os.path.join(subdir, "notes.txt")
+        
+        for file_path in (root_file, sub_file):
+            with open(file_path, "w") as f:
+                f.write("Some notes")
+        
+        # Create a FileFilter instance with a path exclude pattern
+        file_filter = FileFilter(
+            temp_dir,
+            additional_exclude_patterns=["subdir/*.txt"],
+        )
+        filter_func = file_filter.create_filter()
+        
+        # Only the file inside subdir should be excluded
+        assert filter_func(Path(root_file)), "Root file should pass the filter"
+        assert not filter_func(Path(sub_file)), "File in subdir should not pass the filter"
+
+
+def test_read_if_text():
+    """Test reading a file only if it is a text file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a text file and a binary file without known extensions
+        text_file = os.path.join(temp_dir, "README")
+        with open(text_file, "w") as f:
+            f.write("This is a text file")
+        
+        binary_file = os.path.join(temp_dir, "blob")
+        with open(binary_file, "wb") as f:
+            f.write(b"\x00\x01\x02\x03")
+        
+        # Create a FileFilter instance
+        file_filter = FileFilter(temp_dir)
+        
+        # Check that only the text file's content is returned
+        assert file_filter.read_if_text(Path(text_file)) == b"This is a text file"
+        assert file_filter.read_if_text(Path(binary_file)) is None
+
+
+def test_always_text_extensions_skip_content_check():
+    """Test that common code and config files are text without reading them."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # application/json and application/x-sh are not text/* MIME types
+        json_file = os.path.join(temp_dir, "data.json")
+        shell_file = os.path.join(temp_dir, "build.sh")
+        for file_path in (json_file, shell_file):
+            with open(file_path, "w") as f:
+                f.write("{}")
+        
+        # Create a FileFilter instance
+        file_filter = FileFilter(temp_dir)
+        
+        # The files should be recognized as text without being opened
+        with patch("builtins.open", side_effect=AssertionError("file was opened")):
+            assert file_filter.is_text_file(Path(json_file))
+            assert file_filter.is_text_file(Path(shell_file))
+
+
+def test_create_filter_with_ignored_directory():
+    """Test that files inside a directory ignored by .gitignore are excluded."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a .gitignore that ignores a directory
+        with open(os.path.join(temp_dir, ".gitignore"), "w") as f:
+            f.write("build/\n")
+        
+        # Create files inside and outside the ignored directory
+        nested_dir = os.path.join(temp_dir, "build", "nested")
+        os.makedirs(nested_dir)
+        ignored_file = os.path.join(nested_dir, "output.txt")
+        included_file = os.path.join(temp_dir, "main.txt")
+        for file_path in (ignored_file, included_file):
+            with open(file_path, "w") as f:
+                f.write("content")
+        
+        # Create a FileFilter instance
+        file_filter = FileFilter(temp_dir)
+        filter_func = file_filter.create_filter()
+        
+        # Check that only the file outside the ignored directory passes
+        assert filter_func(included_file)
+        assert not filter_func(ignored_file)
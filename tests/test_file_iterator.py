@@ -0,0 +1,169 @@
+"""Tests for the FileIterator class."""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from context_creator.file_iterator import (
+    MAX_PENDING_FILES,
+    READ_BATCH_SIZE,
+    FileIterator,
+)
+
+
+def test_iterate_files_many_files():
+    """Test iterating over more files than are read concurrently."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create more files than the number of pending reads
+        num_files = MAX_PENDING_FILES * 3
+        for i in range(num_files):
+            with open(os.path.join(temp_dir, f"file{i}.txt"), "w") as f:
+                f.write(f"content {i}")
+        
+        # Create a FileIterator instance with a small thread pool
+        file_iterator = FileIterator(temp_dir, max_workers=4)
+        
+        # Check that every file is yielded once with its content
+        file_infos = list(file_iterator.iterate_files())
+        assert len(file_infos) == num_files
+        contents = {fi.relative_path: fi.content for fi in file_infos}
+        for i in range(num_files):
+            assert contents[Path(f"file{i}.txt")] == f"content {i}"
+
+
+def test_iterate_files_uses_all_workers():
+    """Test that every thread in the pool reads files at the same time."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Use more threads than there are full-size batches in the window
+        max_workers = 8
+        assert max_workers > MAX_PENDING_FILES // READ_BATCH_SIZE
+        num_files = MAX_PENDING_FILES * 2
+        for i in range(num_files):
+            with open(os.path.join(temp_dir, f"file{i}.txt"), "w") as f:
+                f.write(f"content {i}")
+        
+        # Create a FileIterator instance with a filter whose first calls only
+        # return once max_workers of them are running at the same time
+        barrier = threading.Barrier(max_workers, timeout=10)
+        lock = threading.Lock()
+        calls = 0
+        
+        def waiting_filter(path):
+            nonlocal calls
+            with lock:
+                calls += 1
+                first_round = calls <= max_workers
+            if first_round:
+                barrier.wait()
+            return True
+        
+        file_iterator = FileIterator(
+            temp_dir, file_filter=waiting_filter, max_workers=max_workers
+        )
+        
+        # Check that all files are yielded; with fewer busy threads the
+        # barrier would time out and the iteration would raise
+        assert len(list(file_iterator.iterate_files())) == num_files
+
+
+def test_iterate_files_skips_binary_files():
+    """Test that the default filter skips files whose content is binary."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a text file and a binary file without known extensions
+        with open(os.path.join(temp_dir, "README"), "w") as f:
+            f.write("Read me")
+        with open(os.path.join(temp_dir, "blob"), "wb") as f:
+            f.write(b"\x00\x01\x02\x03")
+        
+        # Create a FileIterator instance
+        file_iterator = FileIterator(temp_dir)
+        
+        # Check that only the text file is yielded
+        file_infos = list(file_iterator.iterate_files())
+        assert [fi.relative_path for fi in file_infos] == [Path("README")]
+        assert file_infos[0].content == "Read me"
+
+
+def test_get_file_type():
+    """Test getting the file type from a file name or path."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_iterator = FileIterator(temp_dir)
+        
+        assert file_iterator.get_file_type("main.py") == "python"
+        assert file_iterator.get_file_type("App.JS") == "javascript"
+        assert file_iterator.get_file_type(Path("src/lib.rs")) == "rust"
+        assert file_iterator.get_file_type("Makefile") == "text"
+        assert file_iterator.get_file_type(".py") == "text"
+
+
+def test_iterate_files_with_custom_filter_skips_binary_files():
+    """Test that binary content is skipped when a custom filter is given."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a text file and a binary file
+        with open(os.path.join(temp_dir, "notes.txt"), "w") as f:
+            f.write("Some notes")
+        with open(os.path.join(temp_dir, "image.dat"), "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n\x00\x00")
+        
+        # Create a FileIterator instance with a filter that includes everything
+        file_iterator = FileIterator(temp_dir, file_filter=lambda path: True)
+        
+        # Check that only the text file is yielded
+        file_infos = list(file_iterator.iterate_files())
+        assert [fi.relative_path for fi in file_infos] == [Path("notes.txt")]
+
+
+def test_iterate_files_with_custom_filter_gets_paths():
+    """Test that a custom filter is called with Path objects."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a Python file and a text file
+        with open(os.path.join(temp_dir, "main.py"), "w") as f:
+            f.write("print('Hello')")
+        with open(os.path.join(temp_dir, "notes.txt"), "w") as f:
+            f.write("Some notes")
+        
+        # Create a FileIterator instance with a filter that uses the Path API
+        file_iterator = FileIterator(temp_dir, file_filter=lambda path: path.suffix == ".py")
+        
+        # Check that only the Python file is yielded
+        file_infos = list(file_iterator.iterate_files())
+        assert [fi.relative_path for fi in file_infos] == [Path("main.py")]
+
+
+def test_iterate_files_sorted():
+    """Test iterating over files in order of their relative paths."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create files in nested directories, more than are read at once
+        relative_paths = []
+        for i in range(MAX_PENDING_FILES):
+            relative_path = os.path.join(f"dir{i % 3}", f"file{i}.txt")
+            os.makedirs(os.path.join(temp_dir, f"dir{i % 3}"), exist_ok=True)
+            with open(os.path.join(temp_dir, relative_path), "w") as f:
+                f.write(f"content {i}")
+            relative_paths.append(relative_path)
+        
+        # Create a FileIterator instance
+        file_iterator = FileIterator(temp_dir, max_workers=4)
+        
+        # Check that the files are yielded in sorted order
+        file_infos = list(file_iterator.iterate_files(sort=True))
+        assert [str(fi.relative_path) for fi in file_infos] == sorted(relative_paths)
+
+
+def test_iterate_files_excludes_directories_by_pattern():
+    """Test that exclude patterns without a separator also exclude directories."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a file inside a directory matching the pattern and one outside
+        os.makedirs(os.path.join(temp_dir, "node_modules", "pkg"))
+        with open(os.path.join(temp_dir, "node_modules", "pkg", "index.js"), "w") as f:
+            f.write("module.exports = {};")
+        with open(os.path.join(temp_dir, "main.js"), "w") as f:
+            f.write("require('pkg');")
+        
+        # Create a FileIterator instance with the directory name as a pattern
+        file_iterator = FileIterator(temp_dir, additional_exclude_patterns=["node_modules"])
+        
+        # Check that the directory was not descended into
+        file_infos = list(file_iterator.iterate_files())
+        assert [fi.relative_path for fi in file_infos] == [Path("main.js")]
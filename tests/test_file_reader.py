@@ -0,0 +1,68 @@
+"""Tests for the file_reader module."""
+
+import errno
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from context_creator.file_reader import READ_CHUNK_SIZE, read_file_bytes
+
+
+def test_read_file_bytes():
+    """Test reading files of various sizes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        contents = {
+            "empty.txt": b"",
+            "small.txt": b"hello\nworld\n",
+            "large.txt": b"x" * (3 * READ_CHUNK_SIZE + 7),
+        }
+        
+        for filename, content in contents.items():
+            file_path = os.path.join(temp_dir, filename)
+            with open(file_path, "wb") as f:
+                f.write(content)
+            
+            # Check that the whole content is read back
+            assert read_file_bytes(file_path) == content, f"{filename} was not read correctly"
+
+
+def test_read_file_bytes_with_short_reads():
+    """Test that a file is read completely when os.read returns less than asked."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "file.txt")
+        content = b"This file is read a few bytes at a time"
+        with open(file_path, "wb") as f:
+            f.write(content)
+        
+        # Cap each read, as the OS does for reads of more than about 2 GiB
+        real_read = os.read
+        with patch("context_creator.file_reader.os.read", lambda fd, n: real_read(fd, min(n, 5))):
+            assert read_file_bytes(file_path) == content
+
+
+@pytest.mark.skipif(not hasattr(os, "O_NOATIME"), reason="O_NOATIME is Linux-only")
+def test_read_file_bytes_without_noatime_permission():
+    """Test that files the caller does not own are read without O_NOATIME."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "file.txt")
+        with open(file_path, "wb") as f:
+            f.write(b"content")
+        
+        # Simulate the EPERM the kernel returns for O_NOATIME on other users' files
+        real_open = os.open
+        
+        def fake_open(path, flags, *args, **kwargs):
+            if flags & os.O_NOATIME:
+                raise PermissionError(errno.EPERM, "Operation not permitted")
+            return real_open(path, flags, *args, **kwargs)
+        
+        with patch("context_creator.file_reader._use_noatime", True), \
+                patch("os.open", side_effect=fake_open) as mock_open:
+            assert read_file_bytes(file_path) == b"content"
+            assert read_file_bytes(file_path) == b"content"
+        
+        # Check that O_NOATIME was only attempted once
+        noatime_calls = [c for c in mock_open.call_args_list if c.args[1] & os.O_NOATIME]
+        assert len(noatime_calls) == 1
@@ -2,7 +2,6 @@
 
 import os
 import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -20,8 +19,8 @@ def test_create_file_tree_empty_directory():
         
         # Check that the file tree contains only the root directory
         assert len(file_tree) == 1
-        assert Path(temp_dir) in file_tree
-        assert file_tree[Path(temp_dir)] == []
+        assert temp_dir in file_tree
+        assert file_tree[temp_dir] == []
 
 
 def test_create_file_tree_with_files():
@@ -45,9 +44,9 @@ def test_create_file_tree_with_files():
         
         # Check that the file tree contains the root directory and all files
         assert len(file_tree) == 1
-        assert Path(temp_dir) in file_tree
-        assert len(file_tree[Path(temp_dir)]) == 3
-        assert set(str(p) for p in file_tree[Path(temp_dir)]) == set(file_paths)
+        assert temp_dir in file_tree
+        assert len(file_tree[temp_dir]) == 3
+        assert set(file_tree[temp_dir]) == set(file_paths)
 
 
 def test_create_file_tree_with_subdirectories():
@@ -77,15 +76,15 @@ def test_create_file_tree_with_subdirectories():
         
         # Check that the file tree contains all directories and files
         assert len(file_tree) == 3
-        assert Path(temp_dir) in file_tree
-        assert Path(subdir1) in file_tree
-        assert Path(subdir2) in file_tree
-        assert len(file_tree[Path(temp_dir)]) == 1
-        assert len(file_tree[Path(subdir1)]) == 1
-        assert len(file_tree[Path(subdir2)]) == 1
-        assert str(file_tree[Path(temp_dir)][0]) == file_paths[0]
-        assert str(file_tree[Path(subdir1)][0]) == file_paths[1]
-        assert str(file_tree[Path(subdir2)][0]) == file_paths[2]
+        assert temp_dir in file_tree
+        assert subdir1 in file_tree
+        assert subdir2 in file_tree
+        assert len(file_tree[temp_dir]) == 1
+        assert len(file_tree[subdir1]) == 1
+        assert len(file_tree[subdir2]) == 1
+        assert file_tree[temp_dir][0] == file_paths[0]
+        assert file_tree[subdir1][0] == file_paths[1]
+        assert file_tree[subdir2][0] == file_paths[2]
 
 
 def test_create_file_tree_nonexistent_directory():
@@ -108,4 +107,153 @@ def test_create_file_tree_file_as_input():
         
         # Check that creating a FileTreeCreator with a file as input raises an error
         with pytest.raises(NotADirectoryError):
-            FileTreeCreator(file_path) 
\ No newline at end of file
+            FileTreeCreator(file_path)
+
+
+def test_iter_files():
+    """Test iterating over file entries with os.scandir."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create some files in nested directories
+        subdir = os.path.join(temp_dir, "subdir")
+        os.makedirs(subdir)
+        file_paths = [
+            os.path.join(temp_dir, "file1.txt"),
+            os.path.join(subdir, "file2.py"),
+        ]
+        for file_path in file_paths:
+            with open(file_path, "w") as f:
+                f.write("test content")
+        
+        # Create a FileTreeCreator instance
+        creator = FileTreeCreator(temp_dir)
+        
+        # Iterate over the file entries
+        entries = list(creator.iter_files())
+        
+        # Check that only files are yielded, as DirEntry objects
+        assert all(isinstance(entry, os.DirEntry) for entry in entries)
+        assert set(entry.path for entry in entries) == set(file_paths)
+
+
+def test_iter_files_excludes_directories():
+    """Test that iter_files does not descend into excluded directories."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a file in an excluded directory and one in the root
+        git_dir = os.path.join(temp_dir, ".git")
+        os.makedirs(git_dir)
+        with open(os.path.join(git_dir, "HEAD"), "w") as f:
+            f.write("ref: refs/heads/main")
+        normal_file = os.path.join(temp_dir, "file.txt")
+        with open(normal_file, "w") as f:
+            f.write("test content")
+        
+        # Create a FileTreeCreator instance that excludes .git
+        creator = FileTreeCreator(temp_dir, exclude_dirs={".git"})
+        
+        # Check that only the file outside .git is yielded
+        assert [entry.path for entry in creator.iter_files()] == [normal_file]
+
+
+def test_iter_files_parallel():
+    """Test that scanning directories on a thread pool yields every file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a few levels of nested directories with files
+        file_paths = []
+        for i in range(5):
+            dir_path = os.path.join(temp_dir, *[f"dir{j}" for j in range(i)])
+            os.makedirs(dir_path, exist_ok=True)
+            for k in range(3):
+                file_path = os.path.join(dir_path, f"file{k}.txt")
+                with open(file_path, "w") as f:
+                    f.write("test content")
+                file_paths.append(file_path)
+        
+        # Create a FileTreeCreator instance that scans with several threads
+        creator = FileTreeCreator(temp_dir, max_workers=4)
+        
+        # Check that all files are yielded exactly once
+        paths = [entry.path for entry in creator.iter_files()]
+        assert sorted(paths) == sorted(file_paths)
+
+
+def test_iter_files_with_dir_filter():
+    """Test that iter_files does not descend into directories rejected by dir_filter."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a file in a directory to be filtered and one in the root
+        build_dir = os.path.join(temp_dir, "build")
+        os.makedirs(build_dir)
+        with open(os.path.join(build_dir, "output.txt"), "w") as f:
+            f.write("build output")
+        normal_file = os.path.join(temp_dir, "file.txt")
+        with open(normal_file, "w") as f:
+            f.write("test content")
+        
+        # Create a FileTreeCreator instance with a directory filter
+        visited = []
+        
+        def dir_filter(dir_path):
+            visited.append(dir_path)
+            return os.path.basename(dir_path) != "build"
+        
+        creator = FileTreeCreator(temp_dir, dir_filter=dir_filter)
+        
+        # Check that the filter saw the directory and its file was not yielded
+        assert [entry.path for entry in creator.iter_files()] == [normal_file]
+        assert visited == [build_dir]
+
+
+def test_create_file_tree_parallel():
+    """Test that scanning on a thread pool builds the same file tree."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create nested directories, one of them empty
+        subdir = os.path.join(temp_dir, "subdir")
+        os.makedirs(os.path.join(subdir, "empty"))
+        for file_path in (os.path.join(temp_dir, "file1.txt"), os.path.join(subdir, "file2.py")):
+            with open(file_path, "w") as f:
+                f.write("test content")
+        
+        # Check that both ways of scanning produce the same tree
+        serial_tree = FileTreeCreator(temp_dir).create_file_tree()
+        parallel_tree = FileTreeCreator(temp_dir, max_workers=4).create_file_tree()
+        assert parallel_tree == serial_tree
+        assert len(parallel_tree) == 3
+
+
+def test_walk():
+    """Test walking the directory tree one directory at a time."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create some files in nested directories
+        subdir = os.path.join(temp_dir, "subdir")
+        os.makedirs(subdir)
+        file1 = os.path.join(temp_dir, "file1.txt")
+        file2 = os.path.join(subdir, "file2.py")
+        for file_path in (file1, file2):
+            with open(file_path, "w") as f:
+                f.write("test content")
+        
+        # Create a FileTreeCreator instance
+        creator = FileTreeCreator(temp_dir)
+        
+        # Check that walk is lazy and yields the same tree as create_file_tree
+        walker = creator.walk()
+        assert not isinstance(walker, (list, dict))
+        walked = dict(walker)
+        assert walked == creator.create_file_tree()
+        root = str(creator.root_path)
+        assert walked[root] == [os.path.join(root, "file1.txt")]
+        assert walked[os.path.join(root, "subdir")] == [os.path.join(root, "subdir", "file2.py")]
+
+
+def test_as_paths():
+    """Test converting a file tree of strings into one of Path objects."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create a file
+        with open(os.path.join(temp_dir, "file.txt"), "w") as f:
+            f.write("test content")
+        
+        # Create a FileTreeCreator instance and convert its tree
+        creator = FileTreeCreator(temp_dir)
+        path_tree = FileTreeCreator.as_paths(creator.create_file_tree())
+        
+        # Check that the keys and values are Path objects
+        assert path_tree == {creator.root_path: [creator.root_path / "file.txt"]}
@@ -1,44 +1,90 @@
 """Tests for the main module."""
 
-import os
-import sys
-import tempfile
-from unittest.mock import patch, ANY
+import logging
+from unittest.mock import mock_open, patch
 
 import pytest
 
-from context_creator.main import main, parse_args
+from context_creator import main as _main_mod
+from context_creator.main import _build_parser, main, parse_args
 
 
-def test_parse_args():
+@pytest.fixture(scope="module", autouse=True)
+def mock_context_creator():
+    """Patch ContextCreator once for all tests in this module."""
+    with patch.object(_main_mod, "ContextCreator") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    """Restore the handlers and level that main sets on the logger."""
+    logger = logging.getLogger("context_creator")
+    handlers = logger.handlers[:]
+    level = logger.level
+    yield
+    # main adds a handler bound to the current (possibly captured) stderr
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        # Default arguments
+        (
+            [],
+            {
+                "directory": ".",
+                "no_gitignore": False,
+                "exclude": [],
+                "no_clipboard": False,
+                "output": None,
+            },
+        ),
+        # Custom arguments
+        (
+            [
+                "/path/to/dir",
+                "--no-gitignore",
+                "--exclude", "*.log",
+                "--exclude", "*.tmp",
+                "--no-clipboard",
+                "--output", "output.txt",
+            ],
+            {
+                "directory": "/path/to/dir",
+                "no_gitignore": True,
+                "exclude": ["*.log", "*.tmp"],
+                "no_clipboard": True,
+                "output": "output.txt",
+            },
+        ),
+    ],
+)
+def test_parse_args(argv, expected):
     """Test parsing command-line arguments."""
-    # Test with default arguments
-    args = parse_args([])
-    assert args.directory == "."
-    assert not args.no_gitignore
-    assert args.exclude == []
-    assert not args.no_clipboard
-    assert args.output is None
-    
-    # Test with custom arguments
-    args = parse_args([
-        "/path/to/dir",
-        "--no-gitignore",
-        "--exclude", "*.log",
-        "--exclude", "*.tmp",
-        "--no-clipboard",
-        "--output", "output.txt",
-    ])
-    assert args.directory == "/path/to/dir"
-    assert args.no_gitignore
-    assert args.exclude == ["*.log", "*.tmp"]
-    assert args.no_clipboard
-    assert args.output == "output.txt"
-
-
-@patch("context_creator.main.ContextCreator")
+    args = parse_args(argv)
+    for name, value in expected.items():
+        assert getattr(args, name) == value
+    
+    # Check that the parser is built once and reused
+    assert _build_parser() is _build_parser()
+
+
+def test_parse_args_does_not_share_defaults():
+    """Test that the cached parser gives each call its own exclude list."""
+    parse_args([]).exclude.append("leaked")
+    
+    # Check that later calls don't see the appended pattern
+    assert parse_args([]).exclude == []
+    assert parse_args(["--exclude", "*.log"]).exclude == ["*.log"]
+
+
 def test_main_success(mock_context_creator):
     """Test the main function with successful execution."""
+    mock_context_creator.reset_mock(return_value=True, side_effect=True)
+    
     # Mock the ContextCreator instance
     mock_instance = mock_context_creator.return_value
     mock_instance.create_context.return_value = "test context"
@@ -54,44 +100,66 @@ def test_main_success(mock_context_creator):
     mock_instance.create_context.assert_called_once_with(copy_to_clipboard=False)
 
 
-@patch("context_creator.main.ContextCreator")
-def test_main_with_output_file(mock_context_creator):
+def test_main_with_output_file(mock_context_creator, capsys):
     """Test the main function with an output file."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_file = os.path.join(temp_dir, "output.txt")
-        
-        # Mock the ContextCreator instance
-        mock_instance = mock_context_creator.return_value
-        mock_instance.create_context.return_value = "test context"
-        
-        # Call the main function with an output file
-        with patch("builtins.print") as mock_print:
-            exit_code = main(["--output", output_file])
-        
-        # Check that the main function returned success
-        assert exit_code == 0
-        
-        # Check that the output file was created with the correct content
-        with open(output_file, "r") as f:
-            content = f.read()
-        assert content == "test context"
-        
-        # Check that a message was printed
-        mock_print.assert_called_once_with(f"Context written to {output_file}")
-
-
-@patch("context_creator.main.ContextCreator")
-def test_main_error(mock_context_creator):
+    mock_context_creator.reset_mock(return_value=True, side_effect=True)
+    output_file = "/tmp/output.txt"
+    
+    # Mock the ContextCreator instance
+    mock_instance = mock_context_creator.return_value
+    mock_instance.create_context.return_value = "test context"
+    
+    # Call the main function with an output file, writing to an in-memory file
+    m_open = mock_open()
+    with patch.object(_main_mod, "open", m_open, create=True):
+        exit_code = main(["--output", output_file])
+    
+    # Check that the main function returned success
+    assert exit_code == 0
+    
+    # Check that the output file was written with the correct content
+    m_open.assert_called_once_with(output_file, "w", encoding="utf-8")
+    m_open().write.assert_called_once_with("test context")
+    
+    # Check that a message was printed
+    assert capsys.readouterr().out.strip() == f"Context written to {output_file}"
+
+
+def test_main_with_output_file_no_clipboard(mock_context_creator, capsys):
+    """Test streaming the context into an output file without the clipboard."""
+    mock_context_creator.reset_mock(return_value=True, side_effect=True)
+    output_file = "/tmp/output.txt"
+    mock_instance = mock_context_creator.return_value
+    
+    # Call the main function with an output file, writing to an in-memory file
+    m_open = mock_open()
+    with patch.object(_main_mod, "open", m_open, create=True):
+        exit_code = main(["--output", output_file, "--no-clipboard"])
+    
+    # Check that the main function returned success
+    assert exit_code == 0
+    
+    # Check that the context was written straight into the opened file
+    m_open.assert_called_once_with(output_file, "w", encoding="utf-8")
+    mock_instance.write_context.assert_called_once_with(m_open())
+    mock_instance.create_context.assert_not_called()
+    
+    # Check that a message was printed
+    assert capsys.readouterr().out.strip() == f"Context written to {output_file}"
+
+
+def test_main_error(mock_context_creator, capsys):
     """Test the main function with an error."""
+    mock_context_creator.reset_mock(return_value=True, side_effect=True)
+    
     # Mock the ContextCreator instance to raise an exception
     mock_context_creator.side_effect = Exception("Test error")
     
     # Call the main function
-    with patch("builtins.print") as mock_print:
-        exit_code = main([])
+    exit_code = main([])
     
     # Check that the main function returned an error code
     assert exit_code == 1
     
-    # Check that an error message was printed
-    mock_print.assert_called_once_with("Error: Test error", file=ANY) 
\ No newline at end of file
+    # Check that an error message was printed last, after any log output
+    assert capsys.readouterr().err.strip().splitlines()[-1] == "Error: Test error" 
\ No newline at end of file